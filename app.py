@@ -1,17 +1,27 @@
 import os
+import gzip
 import io
-import base64
+import queue
 import secrets
 import sqlite3
 import smtplib
-from datetime import datetime
+import threading
+import time
+from collections import OrderedDict
 from email.message import EmailMessage
 
 from flask import (
-    Flask, request, jsonify, g, redirect, url_for, make_response, render_template_string
+    Flask, Response, request, jsonify, redirect, url_for, make_response
 )
 from dotenv import load_dotenv
+import numpy as np
 import qrcode
+from PIL import Image, features as pil_features
+
+# PNG encode speed depends on which zlib Pillow was linked against
+# (zlib-ng uses hardware CRC-32; see requirements.txt). Surface it once
+# at startup so a slow build is easy to spot in the logs.
+_PIL_ZLIB = pil_features.version("zlib") if pil_features.check("zlib") else None
 
 load_dotenv()
 
@@ -28,46 +38,224 @@ BRAND_NAME = os.getenv("BRAND_NAME", "One-Time QR")
 DB_PATH = os.path.join(os.path.dirname(__file__), "qr_system.db")
 
 # ------------------ DB ------------------
+def _apply_pragmas(db):
+    # WAL lets readers proceed while a verify/issue writes; NORMAL sync is
+    # safe under WAL and skips one fsync per commit. busy_timeout keeps
+    # concurrent scanners from failing fast with SQLITE_BUSY.
+    db.execute("PRAGMA journal_mode=WAL;")
+    db.execute("PRAGMA synchronous=NORMAL;")
+    db.execute("PRAGMA busy_timeout=5000;")
+    db.execute("PRAGMA temp_store=MEMORY;")
+    db.execute("PRAGMA wal_autocheckpoint=1000;")
+
+# One long-lived connection per worker thread instead of a fresh
+# sqlite3.connect per request: connection setup (open + pragmas +
+# statement pre-warm) costs milliseconds, and under WAL the per-thread
+# reader connections proceed concurrently anyway.
+_db_local = threading.local()
+
 def get_db():
-    if 'db' not in g:
-        g.db = sqlite3.connect(DB_PATH)
-        g.db.row_factory = sqlite3.Row
-    return g.db
+    db = getattr(_db_local, 'db', None)
+    if db is None:
+        # isolation_level=None puts the connection in autocommit: reads run
+        # directly against the WAL snapshot with no implicit BEGIN, and
+        # writes manage their own explicit transactions where atomicity
+        # spans more than one statement.
+        # cached_statements=256 (default 128) keeps the compiled bytecode
+        # for every hot query resident, so repeat verifies re-bind
+        # parameters instead of re-parsing SQL.
+        db = sqlite3.connect(DB_PATH, isolation_level=None, detect_types=0,
+                             cached_statements=256, check_same_thread=False)
+        db.row_factory = sqlite3.Row
+        _apply_pragmas(db)
+        _prewarm_statements(db)
+        _db_local.db = db
+    return db
+
+def _prewarm_statements(db):
+    # Compile the hot queries once so the first real scan on this
+    # connection hits the statement cache. The dummy token can't match
+    # anything (tokens are 12 hex chars), so nothing is read or written.
+    db.execute("UPDATE vouchers SET used=1, used_at=? WHERE token=? AND used=0 RETURNING email",
+               (0, "")).fetchone()
+    db.execute("SELECT used FROM vouchers WHERE token=?", ("",)).fetchone()
+    db.execute("SELECT 1 FROM vouchers WHERE token=?", ("",)).fetchone()
 
 def close_db(e=None):
-    db = g.pop('db', None)
-    if db is not None:
-        db.close()
+    # Connections are thread-local and live for the worker's lifetime;
+    # there is nothing to tear down per request. (The periodic maintenance
+    # worker covers PRAGMA optimize.)
+    pass
+
+_VOUCHERS_DDL = """
+    CREATE TABLE IF NOT EXISTS vouchers (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        email TEXT NOT NULL,
+        token TEXT NOT NULL UNIQUE,
+        used INTEGER NOT NULL DEFAULT 0,
+        created_at INTEGER NOT NULL,
+        used_at INTEGER,
+        send_status TEXT NOT NULL DEFAULT 'pending'
+    );
+"""
+
+# Converts a legacy timestamp value to unix nanoseconds: integers pass
+# through, ISO-8601 strings go via strftime, and nanosecond values that
+# landed in a TEXT-affinity column as digit strings are just cast.
+_TS_TO_NS = """
+    CASE
+        WHEN typeof({col}) = 'integer' THEN {col}
+        WHEN {col} GLOB '*[^0-9]*'
+            THEN CAST(strftime('%s', {col}) * 1e9 AS INTEGER)
+        ELSE CAST({col} AS INTEGER)
+    END
+"""
+
+def _migrate_text_timestamps(db):
+    # DBs created before the time_ns() switch have TEXT timestamp columns,
+    # and CREATE TABLE IF NOT EXISTS leaves them be — new rows would keep
+    # text affinity and ISO rows would render as epoch in vouchers_v.
+    # Rebuild the table once with INTEGER columns, converting in place.
+    # The whole rename/create/copy/drop runs in one transaction (the
+    # init_db connection is autocommit, so DDL would otherwise commit
+    # step by step), and a leftover vouchers_legacy table from an
+    # interrupted run triggers a resume instead of being skipped.
+    row = db.execute(
+        "SELECT type FROM pragma_table_info('vouchers') WHERE name='created_at'"
+    ).fetchone()
+    resuming = db.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name='vouchers_legacy'"
+    ).fetchone() is not None
+    if not resuming and (row is None or row[0].upper() == "INTEGER"):
+        return
+    db.execute("BEGIN IMMEDIATE")
+    try:
+        db.execute("DROP VIEW IF EXISTS vouchers_v")
+        if resuming:
+            # A previous run crashed mid-rebuild; the new table is stale
+            # (empty or a partial copy), the legacy table has the data.
+            db.execute("DROP TABLE IF EXISTS vouchers")
+        else:
+            db.execute("ALTER TABLE vouchers RENAME TO vouchers_legacy")
+        db.execute(_VOUCHERS_DDL)
+        db.execute("""
+            INSERT INTO vouchers (id, email, token, used, created_at, used_at, send_status)
+            SELECT id, email, token, used, {created}, {used_at}, send_status
+            FROM vouchers_legacy
+        """.format(created=_TS_TO_NS.format(col='created_at'),
+                   used_at=_TS_TO_NS.format(col='used_at')))
+        db.execute("DROP TABLE vouchers_legacy")
+        db.execute("COMMIT")
+    except Exception:
+        db.execute("ROLLBACK")
+        raise
 
 def init_db():
-    db = get_db()
-    db.execute("""
-        CREATE TABLE IF NOT EXISTS vouchers (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            email TEXT NOT NULL,
-            token TEXT NOT NULL UNIQUE,
-            used INTEGER NOT NULL DEFAULT 0,
-            created_at TEXT NOT NULL,
-            used_at TEXT
-        );
-    """)
-    db.commit()
+    # One-shot schema setup, run once at import time (see below) instead of
+    # on every request — the old before_request hook cost a write
+    # transaction (and an fsync) per HTTP hit. Autocommit so the timestamp
+    # migration fully controls its own transaction boundaries.
+    db = sqlite3.connect(DB_PATH, isolation_level=None)
+    try:
+        _apply_pragmas(db)
+        db.execute(_VOUCHERS_DDL)
+        try:
+            db.execute("ALTER TABLE vouchers ADD COLUMN send_status TEXT NOT NULL DEFAULT 'pending'")
+        except sqlite3.OperationalError:
+            pass  # column already exists (or table was just created with it)
+        _migrate_text_timestamps(db)
+        # Timestamps are unix nanoseconds (time.time_ns()): cheaper to
+        # produce than ISO strings and ~3x smaller in the B-tree leaf.
+        # This view renders them for humans poking at the DB directly.
+        db.execute("""
+            CREATE VIEW IF NOT EXISTS vouchers_v AS
+            SELECT id, email, token, used, send_status,
+                   datetime(created_at / 1e9, 'unixepoch') AS created_at,
+                   datetime(used_at / 1e9, 'unixepoch') AS used_at
+            FROM vouchers;
+        """)
+        # Covering index for the hot verify lookup: SELECT email, used (and
+        # the burn's WHERE token=? AND used=0) resolve entirely in the index,
+        # skipping the rowid fetch the UNIQUE(token) index alone would need.
+        db.execute("""
+            CREATE INDEX IF NOT EXISTS idx_vouchers_token_cov
+            ON vouchers(token, used, email, id);
+        """)
+    finally:
+        db.close()
+
+_DB_MAINT_INTERVAL = 15 * 60  # seconds between WAL checkpoint/optimize passes
+
+def _db_maintenance_worker():
+    # Checkpoint the WAL back into the main DB and truncate it on a fixed
+    # cadence so a long scanning session doesn't grow the WAL unbounded
+    # (and later stall a write on a huge passive checkpoint).
+    while True:
+        time.sleep(_DB_MAINT_INTERVAL)
+        try:
+            db = sqlite3.connect(DB_PATH)
+            try:
+                db.execute("PRAGMA busy_timeout=5000;")
+                db.execute("PRAGMA wal_checkpoint(TRUNCATE);")
+                db.execute("PRAGMA optimize;")
+            finally:
+                db.close()
+        except sqlite3.Error as exc:
+            app.logger.warning("DB maintenance pass failed: %s", exc)
+
+_db_maint_thread = threading.Thread(target=_db_maintenance_worker, daemon=True)
+_db_maint_thread.start()
 
 # ------------------ QR ------------------
 def gen_token():
-    return secrets.token_hex(6).upper()
+    return secrets.token_bytes(6).hex().upper()
+
+_QR_SCALE = 8  # pixels per module
 
 def make_qr_png_bytes(data: str) -> bytes:
-    img = qrcode.make(data)
+    # Tokens are always 12 alphanumeric chars, so the QR geometry is known
+    # up front: version 2 at medium error correction fits them with room to
+    # spare, and fit=False skips qrcode.make()'s version scan.
+    qr = qrcode.QRCode(
+        version=2,
+        error_correction=qrcode.constants.ERROR_CORRECT_M,
+        border=2,
+    )
+    qr.add_data(data)
+    qr.make(fit=False)
+    # Rasterize the module matrix ourselves and hand it straight to
+    # Pillow's C PNG encoder, skipping the library's pure-Python
+    # row-by-row image factory. compress_level=1 skips zlib's max-effort
+    # pass — these small PNGs barely compress anyway.
+    arr = (1 - np.array(qr.get_matrix(), dtype=np.uint8)) * 255
+    arr = np.kron(arr, np.ones((_QR_SCALE, _QR_SCALE), dtype=np.uint8))
     buf = io.BytesIO()
-    img.save(buf, format="PNG")
+    Image.fromarray(arr, 'L').save(buf, format="PNG", compress_level=1)
     return buf.getvalue()
 
-# ------------------ EMAIL (BREVO SMTP) ------------------
-def send_qr_email(to_email: str, token: str, png_bytes: bytes):
-    if not EMAIL_USER or not EMAIL_PASS:
-        raise RuntimeError("EMAIL_USER/EMAIL_PASS missing. Set correctly in Render Environment.")
+# Small LRU of rendered PNGs so the admin page can embed a plain
+# <img src="/qr/<token>.png"> instead of base64-inlining the bytes into
+# the HTML (which costs an extra copy plus ~33% size on the wire).
+_qr_cache = OrderedDict()
+_qr_cache_lock = threading.Lock()
+_QR_CACHE_MAX = 256
+
+def _qr_cache_put(token: str, png_bytes: bytes):
+    with _qr_cache_lock:
+        _qr_cache[token] = png_bytes
+        _qr_cache.move_to_end(token)
+        while len(_qr_cache) > _QR_CACHE_MAX:
+            _qr_cache.popitem(last=False)
 
+def _qr_cache_get(token: str):
+    with _qr_cache_lock:
+        png = _qr_cache.get(token)
+        if png is not None:
+            _qr_cache.move_to_end(token)
+        return png
+
+# ------------------ EMAIL (BREVO SMTP) ------------------
+def build_qr_email(to_email: str, token: str, png_bytes: bytes) -> EmailMessage:
     msg = EmailMessage()
     msg["Subject"] = f"{BRAND_NAME}: Your One-Time QR"
     msg["From"] = f"{SENDER_NAME} <{EMAIL_USER}>"
@@ -80,20 +268,92 @@ def send_qr_email(to_email: str, token: str, png_bytes: bytes):
     """
     msg.add_alternative(html, subtype="html")
     msg.add_attachment(png_bytes, maintype="image", subtype="png", filename=f"{token}.png")
+    return msg
 
-    with smtplib.SMTP(EMAIL_HOST, EMAIL_PORT) as smtp:
-        smtp.starttls()
-        smtp.login(EMAIL_USER, EMAIL_PASS)
-        smtp.send_message(msg)
+def smtp_connect() -> smtplib.SMTP:
+    if not EMAIL_USER or not EMAIL_PASS:
+        raise RuntimeError("EMAIL_USER/EMAIL_PASS missing. Set correctly in Render Environment.")
+    smtp = smtplib.SMTP(EMAIL_HOST, EMAIL_PORT)
+    smtp.starttls()
+    smtp.login(EMAIL_USER, EMAIL_PASS)
+    return smtp
+
+# SMTP is the slow part of /issue (3-7s for STARTTLS + LOGIN + SEND), so
+# sends go through a queue drained by a daemon thread and the request
+# returns as soon as the voucher row is committed. Delivery outcome is
+# recorded on the row as send_status: pending -> sent | failed.
+email_queue = queue.Queue()
+
+_SMTP_IDLE_KEEPALIVE = 60  # seconds of idle before probing with NOOP
+_SMTP_MAX_BACKOFF = 30
+_SMTP_SEND_SPACING = 0.1  # pacing between sends so bulk batches respect provider rate limits
+
+def _set_send_status(token: str, status: str):
+    db = sqlite3.connect(DB_PATH)
+    try:
+        _apply_pragmas(db)
+        db.execute("UPDATE vouchers SET send_status=? WHERE token=?", (status, token))
+        db.commit()
+    finally:
+        db.close()
+
+def _email_worker():
+    # One long-lived SMTP session for all sends: EHLO + STARTTLS + LOGIN
+    # costs seconds per connection on real providers, so reconnecting per
+    # email dominates send time. Reconnect (with exponential backoff) only
+    # when the server drops us; probe idle sessions with NOOP first.
+    smtp = None
+    last_use = 0.0
+    while True:
+        to_email, token, png_bytes = email_queue.get()
+        status = 'sent'
+        try:
+            msg = build_qr_email(to_email, token, png_bytes)
+            delay = 1.0
+            while True:
+                try:
+                    if smtp is not None and time.monotonic() - last_use > _SMTP_IDLE_KEEPALIVE:
+                        smtp.noop()
+                    if smtp is None:
+                        smtp = smtp_connect()
+                    smtp.send_message(msg)
+                    last_use = time.monotonic()
+                    time.sleep(_SMTP_SEND_SPACING)
+                    break
+                except (smtplib.SMTPException, OSError) as exc:
+                    if smtp is not None:
+                        try:
+                            smtp.close()
+                        except Exception:
+                            pass
+                        smtp = None
+                    if delay > _SMTP_MAX_BACKOFF:
+                        raise exc
+                    time.sleep(delay)
+                    delay *= 2
+        except Exception as exc:
+            app.logger.error("email send failed for %s: %s", to_email, exc)
+            status = 'failed'
+        try:
+            _set_send_status(token, status)
+        except Exception as exc:
+            # The status write must never kill the worker: a busy_timeout
+            # expiry here would otherwise end the daemon thread silently
+            # and leave every future voucher stuck at 'pending'.
+            app.logger.error("could not record send_status=%s for %s: %s", status, token, exc)
+        finally:
+            email_queue.task_done()
+
+_email_thread = threading.Thread(target=_email_worker, daemon=True)
+_email_thread.start()
 
 # ------------------ FLASK APP ------------------
 app = Flask(__name__)
 app.secret_key = APP_SECRET
 app.teardown_appcontext(close_db)
+app.logger.info("Pillow zlib: %s", _PIL_ZLIB or "unavailable")
 
-@app.before_request
-def _ensure_db():
-    init_db()
+init_db()
 
 ADMIN_HTML = r"""
 <h1>{{ brand }} — Issue QR</h1>
@@ -105,7 +365,7 @@ ADMIN_HTML = r"""
 {% if last %}
 <h3>Sent to: {{ last.email }}</h3>
 <p>Token: {{ last.token }}</p>
-<img src="data:image/png;base64,{{ last.qr_b64 }}">
+<img src="{{ url_for('qr_png', token=last.token) }}">
 {% endif %}
 
 <hr>
@@ -114,27 +374,100 @@ ADMIN_HTML = r"""
 <p>PIN: {{ pin }}</p>
 """
 
+# Compile once at import: render_template_string re-parses the template
+# source on every request, which is pure waste for these fixed strings.
+admin_template = app.jinja_env.from_string(ADMIN_HTML)
+
 @app.get("/admin")
 def admin():
     host = request.host_url.rstrip('/')
-    return render_template_string(ADMIN_HTML, brand=BRAND_NAME, last=None, scanner_url=f"{host}/scanner", pin=ADMIN_PIN)
+    return admin_template.render(brand=BRAND_NAME, last=None, scanner_url=f"{host}/scanner", pin=ADMIN_PIN)
 
 @app.post("/issue")
 def issue():
     email = request.form.get('email', '').strip()
-    token = gen_token()
-    png = make_qr_png_bytes(token)
 
     db = get_db()
-    db.execute("INSERT INTO vouchers (email, token, used, created_at) VALUES (?, ?, 0, ?)",
-               (email, token, datetime.utcnow().isoformat()))
-    db.commit()
+    # No existence pre-check: the UNIQUE(token) index enforces atomicity,
+    # and on the ~2^-48 chance of a collision we just draw a new token.
+    # Autocommit connection: a single INSERT is its own transaction.
+    while True:
+        token = gen_token()
+        try:
+            db.execute("INSERT INTO vouchers (email, token, used, created_at) VALUES (?, ?, 0, ?)",
+                       (email, token, time.time_ns()))
+            break
+        except sqlite3.IntegrityError:
+            continue
 
-    send_qr_email(email, token, png)
+    png = make_qr_png_bytes(token)
+
+    email_queue.put((email, token, png))
+    _qr_cache_put(token, png)
 
     host = request.host_url.rstrip('/')
-    last = {'email': email, 'token': token, 'qr_b64': base64.b64encode(png).decode('ascii')}
-    return render_template_string(ADMIN_HTML, brand=BRAND_NAME, last=last, scanner_url=f"{host}/scanner", pin=ADMIN_PIN)
+    last = {'email': email, 'token': token}
+    return admin_template.render(brand=BRAND_NAME, last=last, scanner_url=f"{host}/scanner", pin=ADMIN_PIN)
+
+@app.get("/qr/<token>.png")
+def qr_png(token):
+    png = _qr_cache_get(token)
+    if png is None:
+        # Cache miss (eviction or restart): regenerate, but only for
+        # tokens we actually issued.
+        db = get_db()
+        row = db.execute("SELECT 1 FROM vouchers WHERE token=?", (token,)).fetchone()
+        if not row:
+            return jsonify({'status': 'invalid'}), 404
+        png = make_qr_png_bytes(token)
+        _qr_cache_put(token, png)
+    return Response(png, mimetype='image/png',
+                    headers={'Cache-Control': 'private, max-age=60'})
+
+@app.post("/issue_batch")
+def issue_batch():
+    data = request.get_json(silent=True) or {}
+    emails = data.get('emails')
+    # Must be an actual list: a bare string would pass the per-element
+    # str check below and get iterated character by character.
+    if not isinstance(emails, list):
+        return jsonify({'status': 'error', 'message': 'emails must be a list'}), 400
+    emails = [e.strip() for e in emails if isinstance(e, str) and e.strip()]
+    if not emails:
+        return jsonify({'status': 'error', 'message': 'no emails given'}), 400
+
+    now = time.time_ns()
+    db = get_db()
+    # One explicit transaction for the whole batch: with WAL +
+    # synchronous=NORMAL all N inserts amortize into a single group fsync
+    # instead of one per row. A token collision (~2^-48 per draw) aborts
+    # the transaction; redraw the batch's tokens and retry.
+    while True:
+        issued = [{'email': email, 'token': gen_token()} for email in emails]
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            db.executemany("INSERT INTO vouchers (email, token, used, created_at) VALUES (?, ?, 0, ?)",
+                           [(item['email'], item['token'], now) for item in issued])
+            db.execute("COMMIT")
+            break
+        except sqlite3.IntegrityError:
+            db.execute("ROLLBACK")
+            continue
+        except Exception:
+            # Roll back unconditionally: the connection is thread-local and
+            # long-lived, so a transaction left open here would wedge every
+            # later request served by this thread.
+            db.execute("ROLLBACK")
+            raise
+
+    # All sends share the worker's persistent SMTP session; pacing between
+    # sends keeps bulk batches inside provider rate limits.
+    for item in issued:
+        png = make_qr_png_bytes(item['token'])
+        email_queue.put((item['email'], item['token'], png))
+        _qr_cache_put(item['token'], png)
+
+    return jsonify({'status': 'ok', 'issued': issued})
 
 # ------------------ SCANNER PAGE ------------------
 SCANNER_HTML = r"""
@@ -142,27 +475,63 @@ SCANNER_HTML = r"""
 <p>Use your phone camera to scan QR codes.</p>
 """
 
+scanner_template = app.jinja_env.from_string(SCANNER_HTML)
+
+# The scanner page is fully static once the brand is baked in, so render
+# and gzip it once at import — no Jinja and no compression at serve time.
+_SCANNER_BODY = scanner_template.render(brand=BRAND_NAME)
+_SCANNER_GZ = gzip.compress(_SCANNER_BODY.encode('utf-8'), 9)
+
 @app.get("/scanner")
 def scanner():
-    return render_template_string(SCANNER_HTML, brand=BRAND_NAME)
+    # Vary goes on both branches: a shared cache that first sees a
+    # non-gzip client must still key the response on Accept-Encoding.
+    if 'gzip' in request.headers.get('Accept-Encoding', ''):
+        return Response(_SCANNER_GZ, headers={
+            'Content-Encoding': 'gzip',
+            'Content-Type': 'text/html; charset=utf-8',
+            'Vary': 'Accept-Encoding',
+        })
+    return Response(_SCANNER_BODY, headers={
+        'Content-Type': 'text/html; charset=utf-8',
+        'Vary': 'Accept-Encoding',
+    })
 
 # ------------------ VERIFY API ------------------
 @app.post("/api/verify")
 def api_verify():
     pin = request.headers.get('X-Admin-Pin', '')
-    if pin != ADMIN_PIN:
+    # Compare as bytes: compare_digest is only constant-time (and only
+    # defined) for ASCII/bytes, and raises on non-ASCII str input —
+    # surrogateescape keeps arbitrary header bytes encodable.
+    if not secrets.compare_digest(pin.encode('utf-8', 'surrogateescape'),
+                                  ADMIN_PIN.encode('utf-8', 'surrogateescape')):
         return jsonify({'status': 'unauthorized'})
     data = request.get_json(silent=True) or {}
     token = data.get('token', '').strip().upper()
     db = get_db()
-    row = db.execute("SELECT id, email, used FROM vouchers WHERE token=?", (token,)).fetchone()
+    # Single atomic burn: only one of two concurrent scans can match
+    # used=0, so the SELECT-then-UPDATE race window is gone and a valid
+    # scan costs one statement instead of two. BEGIN IMMEDIATE takes the
+    # write lock up front so the burn commits or rolls back as a unit on
+    # the autocommit connection.
+    db.execute("BEGIN IMMEDIATE")
+    try:
+        row = db.execute(
+            "UPDATE vouchers SET used=1, used_at=? WHERE token=? AND used=0 RETURNING email",
+            (time.time_ns(), token),
+        ).fetchone()
+        db.execute("COMMIT")
+    except Exception:
+        db.execute("ROLLBACK")
+        raise
+    if row:
+        return jsonify({'status': 'valid', 'email': row['email']})
+    # Nothing burned: distinguish an unknown token from an already-used one.
+    row = db.execute("SELECT used FROM vouchers WHERE token=?", (token,)).fetchone()
     if not row:
         return jsonify({'status': 'invalid'})
-    if row['used']:
-        return jsonify({'status': 'used'})
-    db.execute("UPDATE vouchers SET used=1, used_at=? WHERE id=?", (datetime.utcnow().isoformat(), row['id']))
-    db.commit()
-    return jsonify({'status': 'valid', 'email': row['email']})
+    return jsonify({'status': 'used'})
 
 @app.get("/")
 def root():